@@ -1,10 +1,20 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+import httpx
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from openai import DefaultAsyncHttpxClient
 
+from src.api.responses import ORJSONResponse
 from src.conversion.request_converter import convert_claude_to_openai
 from src.conversion.response_converter import (
     convert_openai_streaming_to_claude_with_cancellation,
@@ -16,14 +26,73 @@ from src.core.logging import logger
 from src.core.model_manager import model_manager
 from src.models.claude import ClaudeMessagesRequest, ClaudeTokenCountRequest
 
+if TYPE_CHECKING:
+    import tiktoken
+
 router = APIRouter()
 
+# Request headers logged verbatim in debug output, everything else is masked
+_ALLOWED_HDRS = frozenset({"Authorization", "x-api-key", "meta-data"})
+
+# Hot-path config values read as module globals instead of attribute chains.
+# The small model name is interned, as is the model in converted requests, so the
+# equality check in model selection usually short-circuits on identity.
+_SMALL_MODEL = sys.intern(config.small_model)
+
+# Static response headers for SSE streams
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+# The root body only depends on configuration, so encode it once
+_ROOT_BODY_BYTES = orjson.dumps(
+    {
+        "message": "Claude-to-OpenAI API Proxy v1.0.0",
+        "status": "running",
+        "config": {
+            "openai_base_url": config.openai_base_url,
+            "max_tokens_limit": config.max_tokens_limit,
+            "api_key_configured": bool(config.openai_api_key),
+            "client_api_key_validation": bool(config.anthropic_api_key),
+            "big_model": config.big_model,
+            "small_model": config.small_model,
+        },
+        "endpoints": {
+            "messages": "/v1/messages",
+            "count_tokens": "/v1/messages/count_tokens",
+            "health": "/health",
+            "test_connection": "/test-connection",
+        },
+    }
+)
+
+# Tokenizer for count_tokens, loaded on first use. Loading may download the BPE file
+# (point TIKTOKEN_CACHE_DIR at a pre-populated directory to avoid that), so it only ever
+# runs in a worker thread. While it is unavailable a character estimate is used, and a
+# failed load is retried after _ENC_RETRY_SECONDS.
+_ENC_NAME = "cl100k_base"
+_ENC_RETRY_SECONDS = 300
+_ENC: Optional["tiktoken.Encoding"] = None
+_enc_failed_at: Optional[float] = None
+_enc_lock = threading.Lock()
+
+# One connection pool per process, shared by the big and small model clients so TCP/TLS
+# connections are reused across both. Clients are module-level singletons; do not create
+# additional OpenAIClient instances per request.
+_http_limits = httpx.Limits(max_keepalive_connections=64, max_connections=256, keepalive_expiry=300)
+# No explicit transport: httpx only honours HTTP(S)_PROXY/ALL_PROXY when it builds its own
+_shared_http_client = DefaultAsyncHttpxClient(limits=_http_limits, timeout=config.request_timeout)
+
 # Pre-create clients for better performance
 openai_client = OpenAIClient(
     config.openai_api_key or "",  # Provide empty string as fallback but config should always have a key
     config.openai_base_url,
     config.request_timeout,
     api_version=config.azure_api_version,
+    http_client=_shared_http_client,
 )
 
 # Create a separate client for small model with its specific configurations
@@ -34,63 +103,123 @@ if config.small_model_base_url != config.openai_base_url or config.small_model_a
         config.small_model_base_url,
         config.request_timeout,
         api_version=config.azure_api_version,
+        http_client=_shared_http_client,
     )
 else:
     small_model_client = openai_client
 
-
-async def validate_api_key(x_api_key: Optional[str] = Header(None), authorization: Optional[str] = Header(None)):
-    """Validate the client's API key from either x-api-key header or Authorization header."""
-    client_api_key = None
-
-    # Extract API key from headers
-    if x_api_key:
-        client_api_key = x_api_key
-    elif authorization and authorization.startswith("Bearer "):
-        client_api_key = authorization.replace("Bearer ", "")
-
-    # Skip validation if ANTHROPIC_API_KEY is not set in the environment
-    if not config.anthropic_api_key:
-        return
-
-    # Validate the client API key
-    if not client_api_key or not config.validate_client_api_key(client_api_key):
-        logger.warning("Invalid API key provided by client")
-        raise HTTPException(status_code=401, detail="Invalid API key. Please provide a valid Anthropic API key.")
+# Indexed by is_small_model
+_CLIENTS_BY_SIZE = (openai_client, small_model_client)
 
 
 @router.post("/v1/messages")
-async def create_message(request: ClaudeMessagesRequest, http_request: Request, _: None = Depends(validate_api_key)):
+async def create_message(request: ClaudeMessagesRequest, http_request: Request):
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processing Claude request: model=%s, stream=%s", request.model, request.stream
+        )
+        # Read the raw ASGI header list, decoding values only for headers that are shown
+        masked_headers: dict[str, Any] = {}
+        for k, v in http_request.scope["headers"]:
+            name = k.decode("latin-1")
+            masked_headers[name] = v.decode("latin-1") if name in _ALLOWED_HDRS else "*****"
+        logger.debug("Claude request headers: %s", masked_headers)
+
+    if request.stream:
+        return await _handle_stream(request, http_request)
+    return await _handle_non_stream(request)
+
+
+def _prepare_upstream_request(
+    request: ClaudeMessagesRequest,
+) -> tuple[str, dict[str, Any], OpenAIClient]:
+    """Convert the Claude request and pick the upstream client for its model."""
+    # Generate unique request ID for cancellation tracking
+    request_id = str(uuid.uuid4())
+
+    # Convert Claude request to OpenAI format
+    openai_request = convert_claude_to_openai(request, model_manager)
+    logger.debug("Openai request: %s", openai_request)
+
+    # Determine if this is a small model request
+    is_small_model = openai_request["model"] == _SMALL_MODEL
+
+    # Select appropriate client based on model type
+    current_client = _CLIENTS_BY_SIZE[is_small_model]
+    return request_id, openai_request, current_client
+
+
+def _unexpected_error(e: Exception) -> HTTPException:
+    """Log an unexpected error and turn it into a 500 response."""
+    logger.exception("Unexpected error processing request: %s", e)
+    error_message = openai_client.classify_openai_error(str(e))
+    return HTTPException(status_code=500, detail=error_message)
+
+
+async def _buffered(
+    source: AsyncIterator[bytes], max_bytes: int = 8192, max_delay: float = 0.025
+) -> AsyncIterator[bytes]:
+    """Coalesce small SSE chunks, flushing after max_bytes or max_delay seconds."""
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+    buf = bytearray()
+    deadline = 0.0
+    # The pending __anext__ runs as its own task so a flush timeout never cancels the source
+    pending: Optional[asyncio.Future] = None
     try:
-        logger.debug(f"Processing Claude request: model={request.model}, stream={request.stream}")
-        masked_headers: dict[str, Any] = {
-            k: v if k in ("Authorization", "x-api-key", "meta-data") else "*****"
-            for k, v in http_request.headers.items()
-        }
-        logger.debug(f"Claude request headers: {masked_headers}")
-        # Generate unique request ID for cancellation tracking
-        request_id = str(uuid.uuid4())
-
-        # Convert Claude request to OpenAI format
-        openai_request = convert_claude_to_openai(request, model_manager)
-        logger.debug(f"Openai request: {openai_request}")
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            if buf:
+                done, _ = await asyncio.wait({pending}, timeout=max(0.0, deadline - loop.time()))
+                if not done:
+                    yield bytes(buf)
+                    buf.clear()
+                    continue
 
-        # Determine if this is a small model request
-        openai_model = openai_request.get("model")
-        is_small_model = openai_model == config.small_model
-
-        # Select appropriate client based on model type
-        current_client = small_model_client if is_small_model else openai_client
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                pending = None
+                break
+            except Exception:
+                pending = None
+                # Deliver frames converted before the failure, then surface the error
+                if buf:
+                    yield bytes(buf)
+                    buf.clear()
+                raise
+            pending = None
+
+            if not buf:
+                deadline = loop.time() + max_delay
+            buf += chunk
+            if len(buf) >= max_bytes:
+                yield bytes(buf)
+                buf.clear()
+
+        if buf:
+            yield bytes(buf)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
-        # Check if client disconnected before processing
-        if await http_request.is_disconnected():
-            raise HTTPException(status_code=499, detail="Client disconnected")
 
-        if request.stream:
-            # Streaming response - wrap in error handling
-            try:
-                openai_stream = current_client.create_chat_completion_stream(openai_request, request_id)
-                return StreamingResponse(
+async def _handle_stream(request: ClaudeMessagesRequest, http_request: Request):
+    """Streaming branch of create_message, returns an SSE response."""
+    try:
+        request_id, openai_request, current_client = _prepare_upstream_request(request)
+        try:
+            openai_stream = current_client.create_chat_completion_stream(openai_request, request_id)
+            return StreamingResponse(
+                _buffered(
                     convert_openai_streaming_to_claude_with_cancellation(
                         openai_stream,
                         request,
@@ -98,91 +227,130 @@ async def create_message(request: ClaudeMessagesRequest, http_request: Request,
                         http_request,
                         current_client,
                         request_id,
-                    ),
-                    media_type="text/event-stream",
-                    headers={
-                        "Cache-Control": "no-cache",
-                        "Connection": "keep-alive",
-                        "Access-Control-Allow-Origin": "*",
-                        "Access-Control-Allow-Headers": "*",
-                    },
-                )
-            except HTTPException as e:
-                # Convert to proper error response for streaming
-                logger.error(f"Streaming error: {e.detail}")
-                import traceback
-
-                logger.error(traceback.format_exc())
-                error_message = current_client.classify_openai_error(e.detail)
-                error_response = {
-                    "type": "error",
-                    "error": {"type": "api_error", "message": error_message},
-                }
-                return JSONResponse(status_code=e.status_code, content=error_response)
-        else:
-            # Non-streaming response
-            openai_response = await current_client.create_chat_completion(openai_request, request_id)
-            claude_response = convert_openai_to_claude_response(openai_response, request)
-            return claude_response
+                    )
+                ),
+                media_type="text/event-stream",
+                headers=_SSE_HEADERS,
+            )
+        except HTTPException as e:
+            # Convert to proper error response for streaming
+            logger.exception("Streaming error: %s", e.detail)
+            error_message = current_client.classify_openai_error(e.detail)
+            error_response = {
+                "type": "error",
+                "error": {"type": "api_error", "message": error_message},
+            }
+            return ORJSONResponse(status_code=e.status_code, content=error_response)
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-
-        logger.error(f"Unexpected error processing request: {e}")
-        logger.error(traceback.format_exc())
-        error_message = openai_client.classify_openai_error(str(e))
-        raise HTTPException(status_code=500, detail=error_message) from None
+        raise _unexpected_error(e) from None
 
 
-@router.post("/v1/messages/count_tokens")
-async def count_tokens(request: ClaudeTokenCountRequest, _: None = Depends(validate_api_key)):
+async def _handle_non_stream(request: ClaudeMessagesRequest):
+    """Non-streaming branch of create_message, returns the Claude message as JSON."""
     try:
-        # For token counting, we'll use a simple estimation
-        # In a real implementation, you might want to use tiktoken or similar
-
-        total_chars = 0
-
-        # Count system message characters
-        if request.system:
-            if isinstance(request.system, str):
-                total_chars += len(request.system)
-            elif isinstance(request.system, list):
-                for block in request.system:
-                    if hasattr(block, "text"):
-                        total_chars += len(block.text)
-
-        # Count message characters
-        for msg in request.messages:
-            if msg.content is None:
-                continue
-            elif isinstance(msg.content, str):
-                total_chars += len(msg.content)
-            elif isinstance(msg.content, list):
-                for block in msg.content:
-                    if getattr(block, "text", None) is not None:
-                        total_chars += len(getattr(block, "text", ""))
+        request_id, openai_request, current_client = _prepare_upstream_request(request)
+        openai_response = await current_client.create_chat_completion(openai_request, request_id)
+        claude_response = convert_openai_to_claude_response(openai_response, request)
+        return ORJSONResponse(claude_response)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise _unexpected_error(e) from None
+
+
+def _classify_content(content: Any) -> tuple[str, Any]:
+    """Classify system/message content as ("empty", None), ("text", str) or ("blocks", list)."""
+    if not content:
+        return "empty", None
+    if isinstance(content, str):
+        return "text", content
+    if isinstance(content, list):
+        return "blocks", content
+    raise HTTPException(
+        status_code=400, detail=f"Unsupported content type: {type(content).__name__}"
+    )
 
+
+def _collect_texts(request: ClaudeTokenCountRequest) -> list[str]:
+    """Collect every text fragment in the request (system prompt and messages)."""
+    fragments: list[str] = []
+    for content in (request.system, *(msg.content for msg in request.messages)):
+        kind, value = _classify_content(content)
+        if kind == "text":
+            fragments.append(value)
+        elif kind == "blocks":
+            for block in value:
+                text = getattr(block, "text", None)
+                if text:
+                    fragments.append(text)
+    return fragments
+
+
+def _get_encoding() -> Optional["tiktoken.Encoding"]:
+    """Return the tiktoken encoding, or None while it cannot be loaded."""
+    global _ENC, _enc_failed_at
+    if _ENC is not None:
+        return _ENC
+    if _enc_failed_at is not None and time.monotonic() - _enc_failed_at < _ENC_RETRY_SECONDS:
+        return None
+    # Another request is already loading it, don't queue up behind a slow download
+    if not _enc_lock.acquire(blocking=False):
+        return None
+    try:
+        if _ENC is None:
+            import tiktoken
+
+            _ENC = tiktoken.get_encoding(_ENC_NAME)
+    except Exception as e:  # tiktoken missing or encoding download failed
+        _enc_failed_at = time.monotonic()
+        logger.warning(f"tiktoken unavailable, using character-based token estimate: {e}")
+    finally:
+        _enc_lock.release()
+    return _ENC
+
+
+def _count_tokens_sync(fragments: list[str]) -> int:
+    """Count tokens in the fragments; blocking, so run it off the event loop."""
+    enc = _get_encoding()
+    if enc is None:
         # Rough estimation: 4 characters per token
-        estimated_tokens = max(1, total_chars // 4)
+        return max(1, sum(map(len, fragments)) >> 2)
+    return max(1, sum(len(enc.encode_ordinary(text)) for text in fragments))
 
-        return {"input_tokens": estimated_tokens}
 
-    except Exception as e:
-        logger.error(f"Error counting tokens: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) from None
+@router.post("/v1/messages/count_tokens")
+async def count_tokens(request: ClaudeTokenCountRequest):
+    fragments = _collect_texts(request)
+    input_tokens = await run_in_threadpool(_count_tokens_sync, fragments)
+    return ORJSONResponse({"input_tokens": input_tokens})
+
+
+# [epoch second, formatted timestamp] of the last _now_iso() call
+_TS_CACHE: list[Any] = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, cached at one-second resolution."""
+    it = int(time.time())
+    if it != _TS_CACHE[0]:
+        _TS_CACHE[:] = [it, datetime.fromtimestamp(it).isoformat()]
+    return _TS_CACHE[1]
 
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "openai_api_configured": bool(config.openai_api_key),
-        "api_key_valid": config.validate_api_key(),
-        "client_api_key_validation": bool(config.anthropic_api_key),
-    }
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "timestamp": _now_iso(),
+            "openai_api_configured": bool(config.openai_api_key),
+            "api_key_valid": config.validate_api_key(),
+            "client_api_key_validation": bool(config.anthropic_api_key),
+        }
+    )
 
 
 @router.get("/test-connection")
@@ -198,23 +366,25 @@ async def test_connection():
             }
         )
 
-        return {
-            "status": "success",
-            "message": "Successfully connected to OpenAI API",
-            "model_used": config.small_model,
-            "timestamp": datetime.now().isoformat(),
-            "response_id": test_response.get("id", "unknown"),
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "message": "Successfully connected to OpenAI API",
+                "model_used": config.small_model,
+                "timestamp": _now_iso(),
+                "response_id": test_response.get("id", "unknown"),
+            }
+        )
 
     except Exception as e:
         logger.error(f"API connectivity test failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "failed",
                 "error_type": "API Error",
                 "message": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "suggestions": [
                     "Check your OPENAI_API_KEY is valid",
                     "Verify your API key has the necessary permissions",
@@ -227,21 +397,4 @@ async def test_connection():
 @router.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Claude-to-OpenAI API Proxy v1.0.0",
-        "status": "running",
-        "config": {
-            "openai_base_url": config.openai_base_url,
-            "max_tokens_limit": config.max_tokens_limit,
-            "api_key_configured": bool(config.openai_api_key),
-            "client_api_key_validation": bool(config.anthropic_api_key),
-            "big_model": config.big_model,
-            "small_model": config.small_model,
-        },
-        "endpoints": {
-            "messages": "/v1/messages",
-            "count_tokens": "/v1/messages/count_tokens",
-            "health": "/health",
-            "test_connection": "/test-connection",
-        },
-    }
+    return Response(_ROOT_BODY_BYTES, media_type="application/json")
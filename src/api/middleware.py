@@ -0,0 +1,80 @@
+from src.core.config import config
+from src.core.logging import logger
+
+# Paths served without a client API key; everything else requires one when
+# ANTHROPIC_API_KEY is set. Matched against the path relative to root_path.
+PUBLIC_PATHS = frozenset(
+    {
+        "/",
+        "/health",
+        "/test-connection",
+        "/docs",
+        "/docs/oauth2-redirect",
+        "/redoc",
+        "/openapi.json",
+    }
+)
+
+_UNAUTHORIZED_BODY = b'{"detail":"Invalid API key. Please provide a valid Anthropic API key."}'
+_UNAUTHORIZED_START = {
+    "type": "http.response.start",
+    "status": 401,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode("ascii")),
+    ],
+}
+_UNAUTHORIZED_BODY_MESSAGE = {"type": "http.response.body", "body": _UNAUTHORIZED_BODY}
+
+
+def _route_path(scope) -> str:
+    """Path the router matches on, i.e. scope["path"] with any root_path removed."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        stripped = path[len(root_path) :]
+        if not stripped or stripped.startswith("/"):
+            return stripped or "/"
+    return path
+
+
+class APIKeyASGIMiddleware:
+    """Validate the client's API key from either x-api-key header or Authorization header.
+
+    Works on the raw ASGI scope so no Request object is built for the check.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not config.anthropic_api_key
+            or _route_path(scope) in PUBLIC_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Extract API key from headers, x-api-key takes precedence
+        x_api_key = None
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                x_api_key = value
+            elif name == b"authorization":
+                authorization = value
+
+        client_api_key = None
+        if x_api_key:
+            client_api_key = x_api_key
+        elif authorization and authorization.startswith(b"Bearer "):
+            client_api_key = authorization[7:]
+
+        if not client_api_key or not config.validate_client_api_key(client_api_key):
+            logger.warning("Invalid API key provided by client")
+            await send(_UNAUTHORIZED_START)
+            await send(_UNAUTHORIZED_BODY_MESSAGE)
+            return
+
+        await self.app(scope, receive, send)
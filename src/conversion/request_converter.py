@@ -1,4 +1,5 @@
 import json
+import sys
 from typing import Any, Dict, List
 from venv import logger
 
@@ -15,8 +16,8 @@ def convert_claude_to_openai(
         f"Converting Claude request: {claude_request.model_dump(exclude={'messages', 'system', 'tools', 'tool_choice'})}"
     )
 
-    # Map model
-    openai_model = model_manager.map_claude_model_to_openai(claude_request.model)
+    # Map model, interned so equality checks against config model names are cheap
+    openai_model = sys.intern(model_manager.map_claude_model_to_openai(claude_request.model))
 
     # Convert messages
     openai_messages = []
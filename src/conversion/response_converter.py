@@ -1,11 +1,25 @@
 import json
 import uuid
 
+import orjson
 from fastapi import HTTPException, Request
 
 from src.core.constants import Constants
 from src.models.claude import ClaudeMessagesRequest
 
+# Number of upstream chunks between client disconnect checks while streaming
+DISCONNECT_CHECK_INTERVAL = 8
+
+
+def _sse_event(event_name: str, payload: dict) -> bytes:
+    """Frame a payload as an encoded SSE event."""
+    buf = bytearray(b"event: ")
+    buf += event_name.encode("ascii")
+    buf += b"\ndata: "
+    buf += orjson.dumps(payload)
+    buf += b"\n\n"
+    return bytes(buf)
+
 
 def convert_openai_to_claude_response(
     openai_response: dict, original_request: ClaudeMessagesRequest
@@ -86,11 +100,33 @@ async def convert_openai_streaming_to_claude(
     message_id = f"msg_{uuid.uuid4().hex[:24]}"
 
     # Send initial SSE events
-    yield f"event: {Constants.EVENT_MESSAGE_START}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_START, 'message': {'id': message_id, 'type': 'message', 'role': Constants.ROLE_ASSISTANT, 'model': original_request.model, 'content': [], 'stop_reason': None, 'stop_sequence': None, 'usage': {'input_tokens': 0, 'output_tokens': 0}}}, ensure_ascii=False)}\n\n"
-
-    yield f"event: {Constants.EVENT_CONTENT_BLOCK_START}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_START, 'index': 0, 'content_block': {'type': Constants.CONTENT_TEXT, 'text': ''}}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_MESSAGE_START,
+        {
+            "type": Constants.EVENT_MESSAGE_START,
+            "message": {
+                "id": message_id,
+                "type": "message",
+                "role": Constants.ROLE_ASSISTANT,
+                "model": original_request.model,
+                "content": [],
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 0, "output_tokens": 0},
+            },
+        },
+    )
+
+    yield _sse_event(
+        Constants.EVENT_CONTENT_BLOCK_START,
+        {
+            "type": Constants.EVENT_CONTENT_BLOCK_START,
+            "index": 0,
+            "content_block": {"type": Constants.CONTENT_TEXT, "text": ""},
+        },
+    )
 
-    yield f"event: {Constants.EVENT_PING}\ndata: {json.dumps({'type': Constants.EVENT_PING}, ensure_ascii=False)}\n\n"
+    yield _sse_event(Constants.EVENT_PING, {"type": Constants.EVENT_PING})
 
     # Process streaming chunks
     text_block_index = 0
@@ -121,7 +157,14 @@ async def convert_openai_streaming_to_claude(
 
                     # Handle text delta
                     if delta and "content" in delta and delta["content"] is not None:
-                        yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_DELTA, 'index': text_block_index, 'delta': {'type': Constants.DELTA_TEXT, 'text': delta['content']}}, ensure_ascii=False)}\n\n"
+                        yield _sse_event(
+                            Constants.EVENT_CONTENT_BLOCK_DELTA,
+                            {
+                                "type": Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                "index": text_block_index,
+                                "delta": {"type": Constants.DELTA_TEXT, "text": delta["content"]},
+                            },
+                        )
 
                     # Handle tool call deltas with improved incremental processing
                     if "tool_calls" in delta:
@@ -157,7 +200,19 @@ async def convert_openai_streaming_to_claude(
                                 tool_call["claude_index"] = claude_index
                                 tool_call["started"] = True
 
-                                yield f"event: {Constants.EVENT_CONTENT_BLOCK_START}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_START, 'index': claude_index, 'content_block': {'type': Constants.CONTENT_TOOL_USE, 'id': tool_call['id'], 'name': tool_call['name'], 'input': {}}}, ensure_ascii=False)}\n\n"
+                                yield _sse_event(
+                                    Constants.EVENT_CONTENT_BLOCK_START,
+                                    {
+                                        "type": Constants.EVENT_CONTENT_BLOCK_START,
+                                        "index": claude_index,
+                                        "content_block": {
+                                            "type": Constants.CONTENT_TOOL_USE,
+                                            "id": tool_call["id"],
+                                            "name": tool_call["name"],
+                                            "input": {},
+                                        },
+                                    },
+                                )
 
                             # Handle function arguments
                             if (
@@ -172,7 +227,17 @@ async def convert_openai_streaming_to_claude(
                                     json.loads(tool_call["args_buffer"])
                                     # If parsing succeeds and we haven't sent this JSON yet
                                     if not tool_call["json_sent"]:
-                                        yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_DELTA, 'index': tool_call['claude_index'], 'delta': {'type': Constants.DELTA_INPUT_JSON, 'partial_json': tool_call['args_buffer']}}, ensure_ascii=False)}\n\n"
+                                        yield _sse_event(
+                                            Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                            {
+                                                "type": Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                                "index": tool_call["claude_index"],
+                                                "delta": {
+                                                    "type": Constants.DELTA_INPUT_JSON,
+                                                    "partial_json": tool_call["args_buffer"],
+                                                },
+                                            },
+                                        )
                                         tool_call["json_sent"] = True
                                 except json.JSONDecodeError:
                                     # JSON is incomplete, continue accumulating
@@ -192,27 +257,37 @@ async def convert_openai_streaming_to_claude(
 
     except Exception as e:
         # Handle any streaming errors gracefully
-        logger.error(f"Streaming error: {e}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Streaming error: %s", e)
         error_event = {
             "type": "error",
             "error": {"type": "api_error", "message": f"Streaming error: {str(e)}"},
         }
-        yield f"event: error\ndata: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+        yield _sse_event("error", error_event)
         return
 
     # Send final SSE events
-    yield f"event: {Constants.EVENT_CONTENT_BLOCK_STOP}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_STOP, 'index': text_block_index}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_CONTENT_BLOCK_STOP,
+        {"type": Constants.EVENT_CONTENT_BLOCK_STOP, "index": text_block_index},
+    )
 
     for tool_data in current_tool_calls.values():
         if tool_data.get("started") and tool_data.get("claude_index") is not None:
-            yield f"event: {Constants.EVENT_CONTENT_BLOCK_STOP}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_STOP, 'index': tool_data['claude_index']}, ensure_ascii=False)}\n\n"
+            yield _sse_event(
+                Constants.EVENT_CONTENT_BLOCK_STOP,
+                {"type": Constants.EVENT_CONTENT_BLOCK_STOP, "index": tool_data["claude_index"]},
+            )
 
     usage_data = {"input_tokens": 0, "output_tokens": 0}
-    yield f"event: {Constants.EVENT_MESSAGE_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_DELTA, 'delta': {'stop_reason': final_stop_reason, 'stop_sequence': None}, 'usage': usage_data}, ensure_ascii=False)}\n\n"
-    yield f"event: {Constants.EVENT_MESSAGE_STOP}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_STOP}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_MESSAGE_DELTA,
+        {
+            "type": Constants.EVENT_MESSAGE_DELTA,
+            "delta": {"stop_reason": final_stop_reason, "stop_sequence": None},
+            "usage": usage_data,
+        },
+    )
+    yield _sse_event(Constants.EVENT_MESSAGE_STOP, {"type": Constants.EVENT_MESSAGE_STOP})
 
 
 async def convert_openai_streaming_to_claude_with_cancellation(
@@ -228,11 +303,33 @@ async def convert_openai_streaming_to_claude_with_cancellation(
     message_id = f"msg_{uuid.uuid4().hex[:24]}"
 
     # Send initial SSE events
-    yield f"event: {Constants.EVENT_MESSAGE_START}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_START, 'message': {'id': message_id, 'type': 'message', 'role': Constants.ROLE_ASSISTANT, 'model': original_request.model, 'content': [], 'stop_reason': None, 'stop_sequence': None, 'usage': {'input_tokens': 0, 'output_tokens': 0}}}, ensure_ascii=False)}\n\n"
-
-    yield f"event: {Constants.EVENT_CONTENT_BLOCK_START}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_START, 'index': 0, 'content_block': {'type': Constants.CONTENT_TEXT, 'text': ''}}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_MESSAGE_START,
+        {
+            "type": Constants.EVENT_MESSAGE_START,
+            "message": {
+                "id": message_id,
+                "type": "message",
+                "role": Constants.ROLE_ASSISTANT,
+                "model": original_request.model,
+                "content": [],
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 0, "output_tokens": 0},
+            },
+        },
+    )
+
+    yield _sse_event(
+        Constants.EVENT_CONTENT_BLOCK_START,
+        {
+            "type": Constants.EVENT_CONTENT_BLOCK_START,
+            "index": 0,
+            "content_block": {"type": Constants.CONTENT_TEXT, "text": ""},
+        },
+    )
 
-    yield f"event: {Constants.EVENT_PING}\ndata: {json.dumps({'type': Constants.EVENT_PING}, ensure_ascii=False)}\n\n"
+    yield _sse_event(Constants.EVENT_PING, {"type": Constants.EVENT_PING})
 
     # Process streaming chunks
     text_block_index = 0
@@ -240,11 +337,16 @@ async def convert_openai_streaming_to_claude_with_cancellation(
     current_tool_calls = {}
     final_stop_reason = Constants.STOP_END_TURN
     usage_data = {"input_tokens": 0, "output_tokens": 0}
+    chunk_count = 0
 
     try:
         async for line in openai_stream:
-            # Check if client disconnected
-            if await http_request.is_disconnected():
+            # Check if client disconnected, only every few chunks to keep the hot loop cheap
+            chunk_count += 1
+            if (
+                chunk_count % DISCONNECT_CHECK_INTERVAL == 0
+                and await http_request.is_disconnected()
+            ):
                 logger.info(f"Client disconnected, cancelling request {request_id}")
                 openai_client.cancel_request(request_id)
                 break
@@ -284,7 +386,14 @@ async def convert_openai_streaming_to_claude_with_cancellation(
 
                     # Handle text delta
                     if delta and "content" in delta and delta["content"] is not None:
-                        yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_DELTA, 'index': text_block_index, 'delta': {'type': Constants.DELTA_TEXT, 'text': delta['content']}}, ensure_ascii=False)}\n\n"
+                        yield _sse_event(
+                            Constants.EVENT_CONTENT_BLOCK_DELTA,
+                            {
+                                "type": Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                "index": text_block_index,
+                                "delta": {"type": Constants.DELTA_TEXT, "text": delta["content"]},
+                            },
+                        )
 
                     # Handle tool call deltas with improved incremental processing
                     if "tool_calls" in delta and delta["tool_calls"]:
@@ -320,7 +429,19 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                                 tool_call["claude_index"] = claude_index
                                 tool_call["started"] = True
 
-                                yield f"event: {Constants.EVENT_CONTENT_BLOCK_START}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_START, 'index': claude_index, 'content_block': {'type': Constants.CONTENT_TOOL_USE, 'id': tool_call['id'], 'name': tool_call['name'], 'input': {}}}, ensure_ascii=False)}\n\n"
+                                yield _sse_event(
+                                    Constants.EVENT_CONTENT_BLOCK_START,
+                                    {
+                                        "type": Constants.EVENT_CONTENT_BLOCK_START,
+                                        "index": claude_index,
+                                        "content_block": {
+                                            "type": Constants.CONTENT_TOOL_USE,
+                                            "id": tool_call["id"],
+                                            "name": tool_call["name"],
+                                            "input": {},
+                                        },
+                                    },
+                                )
 
                             # Handle function arguments
                             if (
@@ -335,7 +456,17 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                                     json.loads(tool_call["args_buffer"])
                                     # If parsing succeeds and we haven't sent this JSON yet
                                     if not tool_call["json_sent"]:
-                                        yield f"event: {Constants.EVENT_CONTENT_BLOCK_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_DELTA, 'index': tool_call['claude_index'], 'delta': {'type': Constants.DELTA_INPUT_JSON, 'partial_json': tool_call['args_buffer']}}, ensure_ascii=False)}\n\n"
+                                        yield _sse_event(
+                                            Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                            {
+                                                "type": Constants.EVENT_CONTENT_BLOCK_DELTA,
+                                                "index": tool_call["claude_index"],
+                                                "delta": {
+                                                    "type": Constants.DELTA_INPUT_JSON,
+                                                    "partial_json": tool_call["args_buffer"],
+                                                },
+                                            },
+                                        )
                                         tool_call["json_sent"] = True
                                 except json.JSONDecodeError:
                                     # JSON is incomplete, continue accumulating
@@ -363,29 +494,39 @@ async def convert_openai_streaming_to_claude_with_cancellation(
                     "message": "Request was cancelled by client",
                 },
             }
-            yield f"event: error\ndata: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+            yield _sse_event("error", error_event)
             return
         else:
             raise
     except Exception as e:
         # Handle any streaming errors gracefully
-        logger.error(f"Streaming error: {e}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.exception("Streaming error: %s", e)
         error_event = {
             "type": "error",
             "error": {"type": "api_error", "message": f"Streaming error: {str(e)}"},
         }
-        yield f"event: error\ndata: {json.dumps(error_event, ensure_ascii=False)}\n\n"
+        yield _sse_event("error", error_event)
         return
 
     # Send final SSE events
-    yield f"event: {Constants.EVENT_CONTENT_BLOCK_STOP}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_STOP, 'index': text_block_index}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_CONTENT_BLOCK_STOP,
+        {"type": Constants.EVENT_CONTENT_BLOCK_STOP, "index": text_block_index},
+    )
 
     for tool_data in current_tool_calls.values():
         if tool_data.get("started") and tool_data.get("claude_index") is not None:
-            yield f"event: {Constants.EVENT_CONTENT_BLOCK_STOP}\ndata: {json.dumps({'type': Constants.EVENT_CONTENT_BLOCK_STOP, 'index': tool_data['claude_index']}, ensure_ascii=False)}\n\n"
+            yield _sse_event(
+                Constants.EVENT_CONTENT_BLOCK_STOP,
+                {"type": Constants.EVENT_CONTENT_BLOCK_STOP, "index": tool_data["claude_index"]},
+            )
 
-    yield f"event: {Constants.EVENT_MESSAGE_DELTA}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_DELTA, 'delta': {'stop_reason': final_stop_reason, 'stop_sequence': None}, 'usage': usage_data}, ensure_ascii=False)}\n\n"
-    yield f"event: {Constants.EVENT_MESSAGE_STOP}\ndata: {json.dumps({'type': Constants.EVENT_MESSAGE_STOP}, ensure_ascii=False)}\n\n"
+    yield _sse_event(
+        Constants.EVENT_MESSAGE_DELTA,
+        {
+            "type": Constants.EVENT_MESSAGE_DELTA,
+            "delta": {"stop_reason": final_stop_reason, "stop_sequence": None},
+            "usage": usage_data,
+        },
+    )
+    yield _sse_event(Constants.EVENT_MESSAGE_STOP, {"type": Constants.EVENT_MESSAGE_STOP})
@@ -2,6 +2,7 @@ import asyncio
 import json
 from typing import Any, AsyncGenerator, Dict, Optional
 
+import httpx
 from fastapi import HTTPException
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai._exceptions import APIError, AuthenticationError, BadRequestError, RateLimitError
@@ -11,18 +12,30 @@ class OpenAIClient:
     """Async OpenAI client with cancellation support."""
 
     def __init__(
-        self, api_key: str, base_url: str, timeout: int = 90, api_version: Optional[str] = None
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int = 90,
+        api_version: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url
 
-        # Detect if using Azure and instantiate the appropriate client
+        # Detect if using Azure and instantiate the appropriate client.
+        # A shared http_client lets several OpenAIClient instances reuse one connection pool.
         if api_version:
             self.client = AsyncAzureOpenAI(
-                api_key=api_key, azure_endpoint=base_url, api_version=api_version, timeout=timeout
+                api_key=api_key,
+                azure_endpoint=base_url,
+                api_version=api_version,
+                timeout=timeout,
+                http_client=http_client,
             )
         else:
-            self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
+            self.client = AsyncOpenAI(
+                api_key=api_key, base_url=base_url, timeout=timeout, http_client=http_client
+            )
         self.active_requests: Dict[str, asyncio.Event] = {}
 
     async def create_chat_completion(
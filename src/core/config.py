@@ -1,10 +1,36 @@
+import hmac
 import os
 import sys
-import json
+
+import orjson
+
+VALID_LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
 
 
 # Configuration
 class Config:
+    __slots__ = (
+        "openai_api_key",
+        "anthropic_api_key",
+        "_anthropic_api_key_bytes",
+        "openai_base_url",
+        "small_model_base_url",
+        "small_model_api_key",
+        "big_model_extra_body",
+        "small_model_extra_body",
+        "azure_api_version",
+        "host",
+        "port",
+        "log_level",
+        "max_tokens_limit",
+        "min_tokens_limit",
+        "request_timeout",
+        "max_retries",
+        "big_model",
+        "middle_model",
+        "small_model",
+    )
+
     def __init__(self):
         self.openai_api_key = os.environ.get("OPENAI_API_KEY")
         if not self.openai_api_key:
@@ -14,6 +40,10 @@ class Config:
         self.anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY")
         if not self.anthropic_api_key:
             print("Warning: ANTHROPIC_API_KEY not set. Client API key validation will be disabled.")
+        # Pre-encoded for constant-time comparison against client keys
+        self._anthropic_api_key_bytes = (
+            self.anthropic_api_key.encode("utf-8") if self.anthropic_api_key else None
+        )
 
         self.openai_base_url = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
         # Small model specific configurations
@@ -27,7 +57,9 @@ class Config:
         self.azure_api_version = os.environ.get("AZURE_API_VERSION")  # For Azure OpenAI
         self.host = os.environ.get("HOST", "0.0.0.0")
         self.port = int(os.environ.get("PORT", "8082"))
-        self.log_level = os.environ.get("LOG_LEVEL", "INFO")
+        # Normalized lowercase level; only the first word is used so trailing comments are ignored
+        raw_log_level = (os.environ.get("LOG_LEVEL", "INFO").split() or ["info"])[0].lower()
+        self.log_level = raw_log_level if raw_log_level in VALID_LOG_LEVELS else "info"
         self.max_tokens_limit = int(os.environ.get("MAX_TOKENS_LIMIT", "4096"))
         self.min_tokens_limit = int(os.environ.get("MIN_TOKENS_LIMIT", "100"))
 
@@ -46,8 +78,8 @@ class Config:
         if not env_value:
             return None
         try:
-            return json.loads(env_value)
-        except json.JSONDecodeError:
+            return orjson.loads(env_value)
+        except orjson.JSONDecodeError:
             print(f"Warning: Invalid JSON in {env_var_name}, ignoring.")
             return None
 
@@ -61,13 +93,23 @@ class Config:
         return True
 
     def validate_client_api_key(self, client_api_key):
-        """Validate client's Anthropic API key"""
+        """Validate client's Anthropic API key (str or raw header bytes)"""
         # If no ANTHROPIC_API_KEY is set in the environment, skip validation
-        if not self.anthropic_api_key:
+        expected = self._anthropic_api_key_bytes
+        if expected is None:
             return True
 
-        # Check if the client's API key matches the expected value
-        return client_api_key == self.anthropic_api_key
+        # Reject keys that cannot match before encoding them; a str never
+        # encodes to fewer bytes than it has characters
+        if isinstance(client_api_key, str):
+            if len(client_api_key) > len(expected):
+                return False
+            client_api_key = client_api_key.encode("utf-8")
+        if len(client_api_key) != len(expected):
+            return False
+
+        # Constant-time comparison to avoid leaking the key through timing
+        return hmac.compare_digest(expected, client_api_key)
 
 
 try:
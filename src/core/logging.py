@@ -2,13 +2,8 @@ import logging
 
 from src.core.config import config
 
-# Parse log level - extract just the first word to handle comments
-log_level = config.log_level.split()[0].upper()
-
-# Validate and set default if invalid
-valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-if log_level not in valid_levels:
-    log_level = "INFO"
+# Log level is already validated and normalized by Config
+log_level = config.log_level.upper()
 
 # Logging Configuration
 logging.basicConfig(
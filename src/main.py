@@ -4,10 +4,17 @@ import uvicorn
 from fastapi import FastAPI
 
 from src.api.endpoints import router as api_router
+from src.api.middleware import APIKeyASGIMiddleware
+from src.api.responses import ORJSONResponse
 from src.core.config import config
 
-app = FastAPI(title="Claude-to-OpenAI API Proxy", version="1.0.0")
+app = FastAPI(
+    title="Claude-to-OpenAI API Proxy",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
+app.add_middleware(APIKeyASGIMiddleware)
 app.include_router(api_router)
 
 
@@ -61,20 +68,15 @@ def main():
         print(f"   Small Model Extra Body: {config.small_model_extra_body}")
     print("")
 
-    # Parse log level - extract just the first word to handle comments
-    log_level = config.log_level.split()[0].lower()
-
-    # Validate and set default if invalid
-    valid_levels = ["debug", "info", "warning", "error", "critical"]
-    if log_level not in valid_levels:
-        log_level = "info"
-
     # Start server
     uvicorn.run(
         "src.main:app",
         host=config.host,
         port=config.port,
-        log_level=log_level,
+        log_level=config.log_level,
+        # C event loop and HTTP parser; uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         reload=False,
     )
 
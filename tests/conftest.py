@@ -0,0 +1,4 @@
+import os
+
+# src.core.config exits at import time without an upstream key
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
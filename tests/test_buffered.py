@@ -0,0 +1,108 @@
+"""Tests for SSE chunk coalescing in the streaming endpoint."""
+
+import asyncio
+
+import pytest
+
+from src.api.endpoints import _buffered
+
+
+async def collect(source, **kwargs):
+    return [chunk async for chunk in _buffered(source, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_max_bytes_reached():
+    async def source():
+        for chunk in (b"aaaa", b"bbbb", b"cccc"):
+            yield chunk
+
+    assert await collect(source(), max_bytes=8, max_delay=10) == [b"aaaabbbb", b"cccc"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_max_delay():
+    async def source():
+        yield b"a"
+        yield b"b"
+        await asyncio.sleep(0.1)
+        yield b"c"
+
+    assert await collect(source(), max_bytes=8192, max_delay=0.02) == [b"ab", b"c"]
+
+
+@pytest.mark.asyncio
+async def test_source_exception_propagates_after_flushing_buffer():
+    received = []
+
+    async def source():
+        yield b"a"
+        yield b"b"
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        async for chunk in _buffered(source(), max_bytes=8192, max_delay=10):
+            received.append(chunk)
+
+    assert received == [b"ab"]
+
+
+@pytest.mark.asyncio
+async def test_source_exception_with_empty_buffer_propagates():
+    received = []
+
+    async def source():
+        yield b"a"
+        await asyncio.sleep(0.05)
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        async for chunk in _buffered(source(), max_delay=0.01):
+            received.append(chunk)
+
+    assert received == [b"a"]
+
+
+@pytest.mark.asyncio
+async def test_source_closed_when_consumer_cancelled():
+    closed = asyncio.Event()
+    received = []
+
+    async def source():
+        try:
+            yield b"a"
+            await asyncio.sleep(10)
+            yield b"never"
+        finally:
+            closed.set()
+
+    async def consume():
+        async for chunk in _buffered(source(), max_delay=0.01):
+            received.append(chunk)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert received == [b"a"]
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_source_closed_when_consumer_closes_early():
+    closed = asyncio.Event()
+
+    async def source():
+        try:
+            yield b"a"
+            await asyncio.sleep(10)
+        finally:
+            closed.set()
+
+    buffered = _buffered(source(), max_delay=0.01)
+    assert await buffered.__anext__() == b"a"
+    await buffered.aclose()
+
+    assert closed.is_set()
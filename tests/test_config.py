@@ -0,0 +1,52 @@
+"""Tests for client API key validation in Config."""
+
+import pytest
+
+from src.core.config import Config
+
+
+def make_config(monkeypatch, anthropic_api_key):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    if anthropic_api_key is None:
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    else:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", anthropic_api_key)
+    return Config()
+
+
+def test_validation_skipped_without_configured_key(monkeypatch):
+    config = make_config(monkeypatch, None)
+    assert config.validate_client_api_key("anything")
+    assert config.validate_client_api_key(b"anything")
+
+
+@pytest.mark.parametrize("client_api_key", ["secret-key", b"secret-key"])
+def test_accepts_matching_key(monkeypatch, client_api_key):
+    config = make_config(monkeypatch, "secret-key")
+    assert config.validate_client_api_key(client_api_key)
+
+
+@pytest.mark.parametrize(
+    "client_api_key",
+    [
+        "secret-kez",
+        b"secret-kez",
+        "secret",
+        b"secret",
+        "secret-key-and-more",
+        b"secret-key-and-more",
+        "",
+        b"",
+    ],
+)
+def test_rejects_wrong_or_wrong_length_key(monkeypatch, client_api_key):
+    config = make_config(monkeypatch, "secret-key")
+    assert not config.validate_client_api_key(client_api_key)
+
+
+def test_non_ascii_key(monkeypatch):
+    config = make_config(monkeypatch, "kéy")
+    assert config.validate_client_api_key("kéy")
+    assert config.validate_client_api_key("kéy".encode("utf-8"))
+    # Same byte length as the UTF-8 encoded key, but a different value
+    assert not config.validate_client_api_key("keyy")
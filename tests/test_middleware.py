@@ -0,0 +1,128 @@
+"""Tests for the client API key ASGI middleware."""
+
+import pytest
+
+from src.api.middleware import APIKeyASGIMiddleware
+from src.core.config import config
+
+
+class DummyApp:
+    """ASGI app that records whether it was reached."""
+
+    def __init__(self):
+        self.called = False
+
+    async def __call__(self, scope, receive, send):
+        self.called = True
+
+
+async def call_middleware(path="/v1/messages", headers=(), scope_type="http", root_path=""):
+    app = DummyApp()
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": scope_type, "path": path, "root_path": root_path, "headers": list(headers)}
+    await APIKeyASGIMiddleware(app)(scope, receive, send)
+    return app.called, sent
+
+
+@pytest.fixture
+def api_key(monkeypatch):
+    monkeypatch.setattr(config, "anthropic_api_key", "secret-key")
+    monkeypatch.setattr(config, "_anthropic_api_key_bytes", b"secret-key")
+
+
+@pytest.fixture
+def no_api_key(monkeypatch):
+    monkeypatch.setattr(config, "anthropic_api_key", None)
+    monkeypatch.setattr(config, "_anthropic_api_key_bytes", None)
+
+
+@pytest.mark.asyncio
+async def test_passes_through_when_no_key_configured(no_api_key):
+    called, sent = await call_middleware()
+    assert called
+    assert sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/", "/health", "/test-connection"])
+async def test_passes_through_public_paths(api_key, path):
+    called, _ = await call_middleware(path=path)
+    assert called
+
+
+@pytest.mark.asyncio
+async def test_passes_through_public_paths_under_root_path(api_key):
+    called, _ = await call_middleware(path="/api/health", root_path="/api")
+    assert called
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path,root_path",
+    [
+        # uvicorn --root-path puts the full path in scope["path"]
+        ("/api/v1/messages/count_tokens", "/api"),
+        ("/api/v1/messages", "/api"),
+        # The router strips root_path, so a public-looking full path is not public
+        ("/api/health", "/other"),
+        # Unknown paths are protected by default
+        ("/v2/messages", ""),
+        ("/health/extra", ""),
+    ],
+)
+async def test_protects_non_public_paths(api_key, path, root_path):
+    called, sent = await call_middleware(path=path, root_path=root_path)
+    assert not called
+    assert sent[0]["status"] == 401
+
+
+@pytest.mark.asyncio
+async def test_passes_through_non_http_scopes(api_key):
+    called, _ = await call_middleware(scope_type="lifespan")
+    assert called
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers",
+    [
+        [(b"x-api-key", b"secret-key")],
+        [(b"authorization", b"Bearer secret-key")],
+        [(b"x-api-key", b""), (b"authorization", b"Bearer secret-key")],
+    ],
+)
+async def test_accepts_valid_key(api_key, headers):
+    called, sent = await call_middleware(headers=headers)
+    assert called
+    assert sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers",
+    [
+        [],
+        [(b"x-api-key", b"wrong-key!")],
+        [(b"x-api-key", b"secret")],
+        [(b"x-api-key", b"secret-key-and-more")],
+        [(b"authorization", b"secret-key")],
+        [(b"authorization", b"Basic secret-key")],
+        # x-api-key takes precedence over Authorization
+        [(b"x-api-key", b"wrong-key!"), (b"authorization", b"Bearer secret-key")],
+    ],
+)
+async def test_rejects_invalid_key(api_key, headers):
+    called, sent = await call_middleware(headers=headers)
+    assert not called
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == 401
+    assert sent[1]["body"] == (
+        b'{"detail":"Invalid API key. Please provide a valid Anthropic API key."}'
+    )